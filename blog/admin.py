@@ -1,5 +1,44 @@
 from django.contrib import admin
-from .models import Category, Post, Comment
+from django.contrib.admin.views.main import ChangeList
+from django.utils import timezone
+from .models import Category, Post, Comment, get_categories
+
+
+class CategoryListFilter(admin.RelatedFieldListFilter):
+    """Category filter whose choices come from the cached category list"""
+
+    def field_choices(self, field, request, model_admin):
+        # Keeps the stock "empty" choice for uncategorised posts
+        return [(category.pk, category.name) for category in get_categories()]
+
+
+class PostChangeList(ChangeList):
+    """Changelist that only loads the columns PostAdmin displays"""
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .only(
+                "title",
+                "status",
+                "published_at",
+                "created_at",
+                "author__username",
+                "category__name",
+            )
+        )
+
+
+class CommentChangeList(ChangeList):
+    """Changelist that only loads the columns CommentAdmin displays"""
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .only("approved", "created_at", "post__title", "author__username")
+        )
 
 
 @admin.register(Category)
@@ -19,12 +58,18 @@ class PostAdmin(admin.ModelAdmin):
         "published_at",
         "created_at",
     ]
-    list_filter = ["status", "category", "created_at", "published_at"]
+    list_filter = [
+        "status",
+        ("category", CategoryListFilter),
+        "created_at",
+        "published_at",
+    ]
     search_fields = ["title", "content"]
     prepopulated_fields = {"slug": ("title",)}
     date_hierarchy = "published_at"
     ordering = ["-published_at", "-created_at"]
     raw_id_fields = ["author"]
+    list_select_related = ("author", "category")
 
     fieldsets = (
         ("Post Information", {"fields": ("title", "slug", "author", "category")}),
@@ -32,6 +77,12 @@ class PostAdmin(admin.ModelAdmin):
         ("Publication", {"fields": ("status", "published_at")}),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(*self.list_select_related)
+
+    def get_changelist(self, request, **kwargs):
+        return PostChangeList
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
@@ -40,13 +91,28 @@ class CommentAdmin(admin.ModelAdmin):
     search_fields = ["content", "author__username", "post__title"]
     actions = ["approve_comments", "unapprove_comments"]
     raw_id_fields = ["post", "author"]
+    list_select_related = ("post", "author")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(*self.list_select_related)
+
+    def get_changelist(self, request, **kwargs):
+        return CommentChangeList
 
     def approve_comments(self, request, queryset):
-        queryset.update(approved=True)
+        # Skip rows that are already approved so they aren't rewritten.
+        # update() bypasses auto_now; post_detail's ETag reads updated_at
+        updated = queryset.exclude(approved=True).update(
+            approved=True, updated_at=timezone.now()
+        )
+        self.message_user(request, f"{updated} comment(s) approved.")
 
     approve_comments.short_description = "Approve selected comments"
 
     def unapprove_comments(self, request, queryset):
-        queryset.update(approved=False)
+        updated = queryset.exclude(approved=False).update(
+            approved=False, updated_at=timezone.now()
+        )
+        self.message_user(request, f"{updated} comment(s) unapproved.")
 
     unapprove_comments.short_description = "Unapprove selected comments"
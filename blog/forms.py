@@ -1,6 +1,25 @@
 from django import forms
 from .models import Post, Comment
 
+# Shared widget attrs, built once at import; widgets copy attrs on init
+FORM_CONTROL = {"class": "form-control"}
+POST_TITLE_ATTRS = {**FORM_CONTROL, "placeholder": "Enter post title"}
+POST_CONTENT_ATTRS = {
+    **FORM_CONTROL,
+    "rows": 10,
+    "placeholder": "Write your post content here...",
+}
+POST_EXCERPT_ATTRS = {
+    **FORM_CONTROL,
+    "rows": 3,
+    "placeholder": "Brief description of your post (optional)",
+}
+COMMENT_CONTENT_ATTRS = {
+    **FORM_CONTROL,
+    "rows": 4,
+    "placeholder": "Write your comment here...",
+}
+
 
 class PostForm(forms.ModelForm):
     """Form for creating and editing blog posts"""
@@ -9,26 +28,12 @@ class PostForm(forms.ModelForm):
         model = Post
         fields = ["title", "category", "content", "excerpt", "featured_image", "status"]
         widgets = {
-            "title": forms.TextInput(
-                attrs={"class": "form-control", "placeholder": "Enter post title"}
-            ),
-            "category": forms.Select(attrs={"class": "form-control"}),
-            "content": forms.Textarea(
-                attrs={
-                    "class": "form-control",
-                    "rows": 10,
-                    "placeholder": "Write your post content here...",
-                }
-            ),
-            "excerpt": forms.Textarea(
-                attrs={
-                    "class": "form-control",
-                    "rows": 3,
-                    "placeholder": "Brief description of your post (optional)",
-                }
-            ),
-            "featured_image": forms.FileInput(attrs={"class": "form-control"}),
-            "status": forms.Select(attrs={"class": "form-control"}),
+            "title": forms.TextInput(attrs=POST_TITLE_ATTRS),
+            "category": forms.Select(attrs=FORM_CONTROL),
+            "content": forms.Textarea(attrs=POST_CONTENT_ATTRS),
+            "excerpt": forms.Textarea(attrs=POST_EXCERPT_ATTRS),
+            "featured_image": forms.FileInput(attrs=FORM_CONTROL),
+            "status": forms.Select(attrs=FORM_CONTROL),
         }
 
 
@@ -39,12 +44,6 @@ class CommentForm(forms.ModelForm):
         model = Comment
         fields = ["content"]
         widgets = {
-            "content": forms.Textarea(
-                attrs={
-                    "class": "form-control",
-                    "rows": 4,
-                    "placeholder": "Write your comment here...",
-                }
-            ),
+            "content": forms.Textarea(attrs=COMMENT_CONTENT_ATTRS),
         }
         labels = {"content": "Your Comment"}
@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from blog.models import Category, Post, Comment
+from django.db import transaction
+from blog.models import Category, Post, Comment, invalidate_categories
 from django.utils import timezone
 from django.utils.text import slugify
 
@@ -8,32 +10,42 @@ from django.utils.text import slugify
 class Command(BaseCommand):
     help = "Creates sample data for the blog"
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write("Creating sample data...")
 
-        # Create users
-        admin_user, created = User.objects.get_or_create(
-            username="admin",
-            defaults={
-                "email": "admin@example.com",
-                "is_staff": True,
-                "is_superuser": True,
-            },
+        # Create users; passwords are only hashed for users that don't exist yet
+        users_data = [
+            (
+                "admin",
+                "admin123",
+                {"email": "admin@example.com", "is_staff": True, "is_superuser": True},
+            ),
+            ("author", "author123", {"email": "author@example.com"}),
+        ]
+        usernames = [username for username, _, _ in users_data]
+        existing_usernames = set(
+            User.objects.filter(username__in=usernames).values_list(
+                "username", flat=True
+            )
         )
-        if created:
-            admin_user.set_password("admin123")
-            admin_user.save()
-            self.stdout.write(self.style.SUCCESS(f"Created admin user: admin/admin123"))
+        new_users = [
+            User(username=username, password=make_password(password), **fields)
+            for username, password, fields in users_data
+            if username not in existing_usernames
+        ]
+        User.objects.bulk_create(new_users, ignore_conflicts=True)
+        for username, password, _ in users_data:
+            if username not in existing_usernames:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Created {username} user: {username}/{password}"
+                    )
+                )
 
-        author_user, created = User.objects.get_or_create(
-            username="author", defaults={"email": "author@example.com"}
-        )
-        if created:
-            author_user.set_password("author123")
-            author_user.save()
-            self.stdout.write(
-                self.style.SUCCESS(f"Created author user: author/author123")
-            )
+        users = User.objects.in_bulk(usernames, field_name="username")
+        admin_user = users["admin"]
+        author_user = users["author"]
 
         # Create categories
         categories_data = [
@@ -43,14 +55,25 @@ class Command(BaseCommand):
             ("Data Science", "Machine learning and data analysis"),
         ]
 
-        categories = []
-        for name, description in categories_data:
-            category, created = Category.objects.get_or_create(
-                name=name, defaults={"description": description}
+        category_names = [name for name, _ in categories_data]
+        existing_names = set(
+            Category.objects.filter(name__in=category_names).values_list(
+                "name", flat=True
             )
-            categories.append(category)
-            if created:
-                self.stdout.write(self.style.SUCCESS(f"Created category: {name}"))
+        )
+        new_categories = [
+            Category(name=name, slug=slugify(name), description=description)
+            for name, description in categories_data
+            if name not in existing_names
+        ]
+        Category.objects.bulk_create(new_categories, ignore_conflicts=True)
+        # bulk_create() sends no post_save, so clear the cached list ourselves
+        transaction.on_commit(invalidate_categories)
+        for category in new_categories:
+            self.stdout.write(self.style.SUCCESS(f"Created category: {category.name}"))
+
+        categories_by_name = Category.objects.in_bulk(category_names, field_name="name")
+        categories = [categories_by_name[name] for name in category_names]
 
         # Create posts
         posts_data = [
@@ -174,28 +197,49 @@ class Command(BaseCommand):
             },
         ]
 
-        for post_data in posts_data:
-            post, created = Post.objects.get_or_create(
+        published_at = timezone.now()
+        posts = [
+            Post(
                 title=post_data["title"],
-                defaults={
-                    "content": post_data["content"],
-                    "excerpt": post_data["excerpt"],
-                    "category": post_data["category"],
-                    "author": post_data["author"],
-                    "status": "published",
-                    "published_at": timezone.now(),
-                },
+                content=post_data["content"],
+                excerpt=post_data["excerpt"],
+                category=post_data["category"],
+                author=post_data["author"],
+                status="published",
+                published_at=published_at,
             )
-            if created:
-                self.stdout.write(self.style.SUCCESS(f"Created post: {post.title}"))
+            for post_data in posts_data
+        ]
+        Post.prepare_bulk(posts)
+        existing_slugs = set(
+            Post.objects.filter(slug__in=[post.slug for post in posts]).values_list(
+                "slug", flat=True
+            )
+        )
+        new_posts = [post for post in posts if post.slug not in existing_slugs]
+        Post.objects.bulk_create(new_posts, ignore_conflicts=True, batch_size=500)
+        for post in new_posts:
+            self.stdout.write(self.style.SUCCESS(f"Created post: {post.title}"))
 
-                # Add some comments to each post
-                for i in range(2):
-                    Comment.objects.create(
-                        post=post,
-                        author=admin_user if i == 0 else author_user,
-                        content=f"Great article! This is very informative and well-written. Thanks for sharing!",
-                        approved=True,
-                    )
+        # bulk_create(ignore_conflicts=True) doesn't set primary keys, so
+        # re-fetch the new posts before attaching comments to them
+        created_posts = Post.objects.in_bulk(
+            [post.slug for post in new_posts], field_name="slug"
+        )
+
+        # Add some comments to each post
+        pending_comments = [
+            Comment(
+                post=post,
+                author=commenter,
+                content="Great article! This is very informative and well-written. Thanks for sharing!",
+                approved=True,
+            )
+            for post in created_posts.values()
+            for commenter in (admin_user, author_user)
+        ]
+
+        # Insert all comments in one round-trip instead of one per comment
+        Comment.objects.bulk_create(pending_comments, batch_size=500)
 
         self.stdout.write(self.style.SUCCESS("Sample data created successfully!"))
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="comment",
+            name="blog_commen_post_id_a412e1_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="post",
+            name="blog_post_publish_2c9212_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="post",
+            name="blog_post_status_02ce19_idx",
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["post", "approved", "created_at"],
+                name="comment_post_approved_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["status", "-published_at"], name="post_status_pub_idx"
+            ),
+        ),
+    ]
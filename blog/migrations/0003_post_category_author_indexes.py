@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0002_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["category", "status"], name="post_category_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["author", "status"], name="post_author_status_idx"
+            ),
+        ),
+    ]
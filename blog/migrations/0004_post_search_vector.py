@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-15 09:30
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# The text search config must match Post.SEARCH_CONFIG
+CREATE_SEARCH_SQL = [
+    """
+    CREATE FUNCTION blog_post_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B')
+            || setweight(to_tsvector('english', coalesce(NEW.excerpt, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER blog_post_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, content, excerpt ON blog_post
+    FOR EACH ROW EXECUTE FUNCTION blog_post_search_vector_update()
+    """,
+    # Fire the trigger once for existing rows
+    "UPDATE blog_post SET title = title",
+    "CREATE INDEX blog_post_search_vector_idx ON blog_post USING gin (search_vector)",
+]
+
+DROP_SEARCH_SQL = [
+    "DROP INDEX IF EXISTS blog_post_search_vector_idx",
+    "DROP TRIGGER IF EXISTS blog_post_search_vector_trigger ON blog_post",
+    "DROP FUNCTION IF EXISTS blog_post_search_vector_update()",
+]
+
+
+def _run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        # Other backends fall back to icontains search, see PostQuerySet.search
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0003_post_category_author_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(
+            _run_on_postgresql(CREATE_SEARCH_SQL),
+            _run_on_postgresql(DROP_SEARCH_SQL),
+        ),
+    ]
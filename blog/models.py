@@ -1,9 +1,24 @@
-from django.db import models
+from functools import lru_cache
+
+from django.contrib.postgres.search import SearchQuery, SearchVectorField
+from django.db import connections, models
+from django.db.models import Q
+from django.db.models.functions import Substr
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 
 
+@lru_cache(maxsize=4096)
+def _cached_slugify(text):
+    """slugify() is regex-heavy; memoize it for repeated names/titles"""
+    return slugify(text)
+
+
 class Category(models.Model):
     """Category model for organizing blog posts"""
 
@@ -21,13 +36,73 @@ class Category(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
+            self.slug = _cached_slugify(self.name)
         super().save(*args, **kwargs)
 
     def get_absolute_url(self):
         return reverse("category_posts", kwargs={"slug": self.slug})
 
 
+CATEGORIES_CACHE_KEY = "blog:categories:v1"
+CATEGORIES_CACHE_TIMEOUT = 3600
+
+
+def get_categories():
+    """Return all categories, cached until a Category is saved or deleted"""
+    return cache.get_or_set(
+        CATEGORIES_CACHE_KEY,
+        lambda: list(Category.objects.only("id", "name", "slug")),
+        CATEGORIES_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_categories():
+    """Drop the cached category list"""
+    # save()/delete() call this through signals. Code that writes categories
+    # with bulk_create(), update() or raw SQL must call it itself once the
+    # transaction commits: transaction.on_commit(invalidate_categories)
+    cache.delete(CATEGORIES_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def _invalidate_categories_cache(**kwargs):
+    invalidate_categories()
+
+
+class PostQuerySet(models.QuerySet):
+    """Reusable filters for Post queries"""
+
+    def published(self):
+        return self.filter(status="published")
+
+    def search(self, query):
+        """Full-text search on PostgreSQL, substring matching elsewhere"""
+        if connections[self.db].vendor == "postgresql":
+            # search_vector is kept up to date by a trigger (migration 0004)
+            return self.filter(
+                search_vector=SearchQuery(
+                    query, config=Post.SEARCH_CONFIG, search_type="websearch"
+                )
+            )
+        return self.filter(
+            Q(title__icontains=query)
+            | Q(content__icontains=query)
+            | Q(excerpt__icontains=query)
+        )
+
+    def for_listing(self):
+        """Skip the full content column; list pages only need a preview"""
+        return self.defer("content").annotate(
+            content_preview=Substr("content", 1, Post.PREVIEW_LENGTH)
+        )
+
+
+class PostManager(models.Manager.from_queryset(PostQuerySet)):
+    def get_queryset(self):
+        # search_vector is only ever read by the database itself
+        return super().get_queryset().defer("search_vector")
+
+
 class Post(models.Model):
     """Blog post model"""
 
@@ -36,6 +111,12 @@ class Post(models.Model):
         ("published", "Published"),
     ]
 
+    # Characters of content loaded for excerpt-less posts on list pages
+    PREVIEW_LENGTH = 1000
+
+    # Text search configuration used by the search_vector trigger
+    SEARCH_CONFIG = "english"
+
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=200, unique=True, blank=True)
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="posts")
@@ -53,12 +134,21 @@ class Post(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True)
+    # Weighted title/content/excerpt tsvector, maintained on PostgreSQL only
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = PostManager()
 
     class Meta:
         ordering = ["-published_at", "-created_at"]
         indexes = [
-            models.Index(fields=["-published_at"]),
-            models.Index(fields=["status"]),
+            models.Index(
+                fields=["status", "-published_at"], name="post_status_pub_idx"
+            ),
+            models.Index(
+                fields=["category", "status"], name="post_category_status_idx"
+            ),
+            models.Index(fields=["author", "status"], name="post_author_status_idx"),
         ]
 
     def __str__(self):
@@ -66,15 +156,35 @@ class Post(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.title)
+            self.slug = _cached_slugify(self.title)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def prepare_bulk(cls, posts):
+        """Fill in the slugs that save() would set, for use with bulk_create()"""
+        for post in posts:
+            if not post.slug:
+                post.slug = _cached_slugify(post.title)
+        return posts
+
     def get_absolute_url(self):
         return reverse("post_detail", kwargs={"slug": self.slug})
 
-    @property
+    @cached_property
     def approved_comments(self):
-        return self.comments.filter(approved=True)
+        # Reuse comments loaded by prefetch_related("comments") if present
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "comments" in prefetched:
+            return [comment for comment in prefetched["comments"] if comment.approved]
+        return list(self.comments.filter(approved=True))
+
+    @property
+    def has_approved_comments(self):
+        # Answer from already-loaded comments, else a LIMIT 1 EXISTS query
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "approved_comments" in self.__dict__ or "comments" in prefetched:
+            return bool(self.approved_comments)
+        return self.comments.filter(approved=True).exists()
 
 
 class Comment(models.Model):
@@ -90,7 +200,10 @@ class Comment(models.Model):
     class Meta:
         ordering = ["created_at"]
         indexes = [
-            models.Index(fields=["post", "approved"]),
+            models.Index(
+                fields=["post", "approved", "created_at"],
+                name="comment_post_approved_idx",
+            ),
         ]
 
     def __str__(self):
@@ -0,0 +1,21 @@
+from django.contrib.auth.models import User
+from blog.models import Category, Post
+
+
+def create_user(username="testuser", **kwargs):
+    """Create a user without hashing a password (log in with force_login)"""
+    user = User(username=username, **kwargs)
+    user.set_unusable_password()
+    user.save()
+    return user
+
+
+def create_category(name="Tech", **kwargs):
+    """Create a category"""
+    return Category.objects.create(name=name, **kwargs)
+
+
+def create_post(author, title="Test Post", **kwargs):
+    """Create a post with filler content"""
+    kwargs.setdefault("content", "Content" * 20)
+    return Post.objects.create(title=title, author=author, **kwargs)
@@ -1,17 +1,16 @@
 from django.test import TestCase
-from django.contrib.auth.models import User
 from blog.forms import PostForm, CommentForm
-from blog.models import Category, Post
+from blog.models import Post
+from blog.tests.factories import create_category, create_user
 
 
 class PostFormTest(TestCase):
     """Test PostForm"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
 
     def test_post_form_valid_data(self):
         """Test form with valid data"""
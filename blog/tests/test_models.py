@@ -1,14 +1,21 @@
-from django.test import TestCase
-from django.contrib.auth.models import User
-from blog.models import Category, Post, Comment
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from blog.models import Category, Post, Comment, get_categories
+from blog.tests.factories import create_category, create_post, create_user
 
 
 class CategoryModelTest(TestCase):
     """Test Category model"""
 
-    def setUp(self):
-        """Run before each test"""
-        self.category = Category.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Run once for the whole test class"""
+        cls.category = Category.objects.create(
             name="Technology", description="Tech posts"
         )
 
@@ -29,27 +36,66 @@ class CategoryModelTest(TestCase):
         from django.db import IntegrityError
 
         with self.assertRaises(IntegrityError):
-            Category.objects.create(name="Technology")
+            create_category("Technology")
 
     def test_str_method(self):
         """Test string representation"""
         self.assertEqual(str(self.category), "Technology")
 
 
+class CategoryCacheTest(TestCase):
+    """Test the cached category list"""
+
+    def setUp(self):
+        cache.clear()
+        create_category()
+
+    def test_get_categories_cached(self):
+        """Test repeated calls are served from the cache"""
+        get_categories()
+        with self.assertNumQueries(0):
+            self.assertEqual([c.name for c in get_categories()], ["Tech"])
+
+    def test_cache_invalidated_on_save(self):
+        """Test saving a category refreshes the cached list"""
+        get_categories()
+        create_category("Science")
+        self.assertEqual([c.name for c in get_categories()], ["Science", "Tech"])
+
+    def test_cache_invalidated_on_delete(self):
+        """Test deleting a category refreshes the cached list"""
+        get_categories()
+        Category.objects.get(name="Tech").delete()
+        self.assertEqual(get_categories(), [])
+
+    @override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    )
+    def test_cache_invalidated_after_bulk_seed(self):
+        """Test create_sample_data's bulk_create() refreshes the cached list"""
+        get_categories()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("create_sample_data", stdout=StringIO())
+        self.assertEqual(
+            [c.name for c in get_categories()],
+            list(Category.objects.values_list("name", flat=True)),
+        )
+        self.assertGreater(len(get_categories()), 1)
+
+
 class PostModelTest(TestCase):
     """Test Post model"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data"""
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
-        self.post = Post.objects.create(
+        cls.user = create_user()
+        cls.category = create_category()
+        cls.post = Post.objects.create(
             title="Test Post",
             content="Test content that is long enough to be valid.",
-            author=self.user,
-            category=self.category,
+            author=cls.user,
+            category=cls.category,
             status="published",
         )
 
@@ -63,8 +109,15 @@ class PostModelTest(TestCase):
         """Test slug generated from title"""
         self.assertEqual(self.post.slug, "test-post")
 
+    def test_prepare_bulk_sets_slugs(self):
+        """Test prepare_bulk() fills slugs without overwriting explicit ones"""
+        posts = Post.prepare_bulk(
+            [Post(title="Bulk Post"), Post(title="Other", slug="custom-slug")]
+        )
+        self.assertEqual([post.slug for post in posts], ["bulk-post", "custom-slug"])
+
     def test_published_posts(self):
-        """Test filtering published posts"""
+        """Test published() queryset filter"""
         draft_post = Post.objects.create(
             title="Draft",
             content="Draft content" * 10,
@@ -72,11 +125,16 @@ class PostModelTest(TestCase):
             category=self.category,
             status="draft",
         )
-        # Filter published posts manually (no manager exists)
-        published = Post.objects.filter(status="published")
+        published = Post.objects.published()
         self.assertIn(self.post, published)
         self.assertNotIn(draft_post, published)
 
+    def test_for_listing_defers_content(self):
+        """Test for_listing() loads a content preview instead of content"""
+        post = Post.objects.for_listing().get(pk=self.post.pk)
+        self.assertIn("content", post.get_deferred_fields())
+        self.assertEqual(post.content_preview, self.post.content)
+
     def test_approved_comments(self):
         """Test approved_comments property"""
         # Create approved comment
@@ -90,25 +148,86 @@ class PostModelTest(TestCase):
             content="Unapproved comment",
             approved=False,
         )
-        self.assertEqual(self.post.approved_comments.count(), 1)
+        self.assertEqual(len(self.post.approved_comments), 1)
 
+    def test_has_approved_comments(self):
+        """Test has_approved_comments ignores unapproved comments"""
+        Comment.objects.create(
+            post=self.post, author=self.user, content="Pending", approved=False
+        )
+        self.assertFalse(self.post.has_approved_comments)
+        Comment.objects.create(
+            post=self.post, author=self.user, content="Approved", approved=True
+        )
+        self.assertTrue(self.post.has_approved_comments)
 
-class CommentModelTest(TestCase):
-    """Test Comment model"""
+    def test_approved_comments_uses_prefetch(self):
+        """Test approved_comments reads prefetched comments without a query"""
+        Comment.objects.create(
+            post=self.post, author=self.user, content="Approved comment", approved=True
+        )
+        Comment.objects.create(
+            post=self.post, author=self.user, content="Pending", approved=False
+        )
+        post = Post.objects.prefetch_related("comments").get(pk=self.post.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(post.approved_comments), 1)
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
+    def test_approved_comments_cached(self):
+        """Test approved_comments is evaluated once per instance"""
+        Comment.objects.create(
+            post=self.post, author=self.user, content="Approved comment", approved=True
         )
-        self.category = Category.objects.create(name="Tech")
-        self.post = Post.objects.create(
-            title="Test Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
+        list(self.post.approved_comments)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.post.approved_comments), 1)
+
+
+class PostSearchTest(TestCase):
+    """Test PostQuerySet.search()"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.django_post = Post.objects.create(
+            title="Getting Started with Django",
+            content="Models, views and templates.",
+            author=cls.user,
+            status="published",
+        )
+        cls.python_post = Post.objects.create(
+            title="Python Tips",
+            content="Write small functions.",
+            excerpt="Tips about functions",
+            author=cls.user,
+            status="published",
         )
-        self.comment = Comment.objects.create(
-            post=self.post, author=self.user, content="Test comment"
+
+    def test_search_title(self):
+        """Test search matches post titles"""
+        self.assertEqual(list(Post.objects.search("django")), [self.django_post])
+
+    def test_search_content_and_excerpt(self):
+        """Test search matches content and excerpt"""
+        self.assertEqual(list(Post.objects.search("templates")), [self.django_post])
+        self.assertEqual(list(Post.objects.search("functions")), [self.python_post])
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL full-text search")
+    def test_search_uses_stemming(self):
+        """Test PostgreSQL search matches word stems via search_vector"""
+        self.assertEqual(list(Post.objects.search("model")), [self.django_post])
+
+
+class CommentModelTest(TestCase):
+    """Test Comment model"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
+        cls.post = create_post(cls.user, category=cls.category)
+        cls.comment = Comment.objects.create(
+            post=cls.post, author=cls.user, content="Test comment"
         )
 
     def test_comment_creation(self):
@@ -1,35 +1,38 @@
-from django.test import TestCase, Client
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User
-from blog.models import Category, Post
+from blog.models import Comment, Post
+from blog.tests.factories import create_category, create_post, create_user
 
 
-class HomeViewTest(TestCase):
-    """Test home view"""
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class ViewTestCase(TestCase):
+    """Base class: fast password hashing and an empty cache for every test"""
 
     def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
+        # Cached categories outlive the rows each test rolls back
+        cache.clear()
+
+
+class HomeViewTest(ViewTestCase):
+    """Test home view"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
 
         # Create published post
-        self.post = Post.objects.create(
-            title="Published Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-            status="published",
+        cls.post = create_post(
+            cls.user, title="Published Post", category=cls.category, status="published"
         )
 
         # Create draft post
-        self.draft = Post.objects.create(
-            title="Draft Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-            status="draft",
+        cls.draft = create_post(
+            cls.user, title="Draft Post", category=cls.category, status="draft"
         )
 
     def test_home_view_status_code(self):
@@ -48,6 +51,32 @@ class HomeViewTest(TestCase):
         self.assertContains(response, "Published Post")
         self.assertNotContains(response, "Draft Post")
 
+    def test_home_view_categories_cached(self):
+        """Test the category sidebar is cached but refreshed on changes"""
+        response = self.client.get(reverse("home"))
+        self.assertEqual(response.context["categories"], [self.category])
+        # ETag aggregate + page count + posts, no categories
+        with self.assertNumQueries(3):
+            self.client.get(reverse("home"))
+        create_category("Science")
+        response = self.client.get(reverse("home"))
+        self.assertContains(response, "Science")
+
+    def test_home_view_not_modified(self):
+        """Test an unchanged home page is revalidated with a 304"""
+        etag = self.client.get(reverse("home"))["ETag"]
+        response = self.client.get(reverse("home"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        create_post(self.user, title="Newer Post", status="published")
+        response = self.client.get(reverse("home"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_home_view_no_etag_when_logged_in(self):
+        """Test personalised pages are not revalidated"""
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("home"))
+        self.assertFalse(response.has_header("ETag"))
+
     def test_home_view_search(self):
         """Test search functionality"""
         response = self.client.get(reverse("home") + "?q=Published")
@@ -55,22 +84,14 @@ class HomeViewTest(TestCase):
         self.assertNotContains(response, "Draft Post")
 
 
-class PostDetailViewTest(TestCase):
+class PostDetailViewTest(ViewTestCase):
     """Test post detail view"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
-        self.post = Post.objects.create(
-            title="Test Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-            status="published",
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
+        cls.post = create_post(cls.user, category=cls.category, status="published")
 
     def test_post_detail_view(self):
         """Test post detail page loads"""
@@ -80,6 +101,34 @@ class PostDetailViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Test Post")
 
+    def test_post_detail_comments_query_count(self):
+        """Test comments and their authors load without per-comment queries"""
+        other_user = create_user("reader")
+        for author in (self.user, other_user):
+            Comment.objects.create(
+                post=self.post, author=author, content="Nice", approved=True
+            )
+        Comment.objects.create(
+            post=self.post, author=other_user, content="Pending", approved=False
+        )
+        url = reverse("post_detail", kwargs={"slug": self.post.slug})
+        with self.assertNumQueries(3):  # ETag aggregate + post + comments
+            response = self.client.get(url)
+        self.assertEqual(len(response.context["comments"]), 2)
+        self.assertContains(response, "reader")
+
+    def test_post_detail_not_modified(self):
+        """Test an unchanged post is revalidated until a comment is added"""
+        url = reverse("post_detail", kwargs={"slug": self.post.slug})
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        Comment.objects.create(
+            post=self.post, author=self.user, content="Nice", approved=True
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, "Nice")
+
     def test_post_detail_404(self):
         """Test 404 for non-existent post"""
         response = self.client.get(
@@ -88,66 +137,50 @@ class PostDetailViewTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
-class CreatePostViewTest(TestCase):
+class CreatePostViewTest(ViewTestCase):
     """Test create post view"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
-
-    def test_create_post_requires_login(self):
-        """Test redirect if not logged in"""
-        response = self.client.get(reverse("create_post"))
-        self.assertEqual(response.status_code, 302)  # Redirect
-        self.assertIn("/login/", response.url)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
 
     def test_create_post_logged_in(self):
         """Test create post when logged in"""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.get(reverse("create_post"))
         self.assertEqual(response.status_code, 200)
 
     def test_create_post_submission(self):
         """Test creating a post"""
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.post(
-            reverse("create_post"),
-            {
-                "title": "New Post",
-                "content": "New content" * 20,
-                "category": self.category.id,
-                "status": "draft",
-            },
-        )
+        self.client.force_login(self.user)
+        with self.assertNumQueries(5):
+            response = self.client.post(
+                reverse("create_post"),
+                {
+                    "title": "New Post",
+                    "content": "New content" * 20,
+                    "category": self.category.id,
+                    "status": "draft",
+                },
+            )
         self.assertEqual(response.status_code, 302)  # Redirect after success
-        self.assertTrue(Post.objects.filter(title="New Post").exists())
+        self.assertTrue(Post.objects.filter(slug="new-post").exists())
 
 
-class EditPostViewTest(TestCase):
+class EditPostViewTest(ViewTestCase):
     """Test edit post view"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="otheruser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
-        self.post = Post.objects.create(
-            title="Test Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.other_user = create_user("otheruser")
+        cls.category = create_category()
+        cls.post = create_post(cls.user, category=cls.category)
 
     def test_edit_own_post(self):
         """Test author can edit own post"""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.get(
             reverse("edit_post", kwargs={"slug": self.post.slug})
         )
@@ -155,107 +188,112 @@ class EditPostViewTest(TestCase):
 
     def test_cannot_edit_others_post(self):
         """Test user cannot edit others' posts"""
-        self.client.login(username="otheruser", password="testpass123")
+        self.client.force_login(self.other_user)
         response = self.client.get(
             reverse("edit_post", kwargs={"slug": self.post.slug})
         )
         # View redirects to post detail with error message
-        self.assertEqual(response.status_code, 302)
-        self.assertIn("/post/test-post/", response.url)
+        self.assertRedirects(
+            response,
+            reverse("post_detail", kwargs={"slug": self.post.slug}),
+            fetch_redirect_response=False,
+        )
 
     def test_staff_can_edit_any_post(self):
         """Test staff can edit any post"""
-        staff_user = User.objects.create_user(
-            username="staff", password="testpass123", is_staff=True
-        )
-        self.client.login(username="staff", password="testpass123")
+        staff_user = create_user("staff", is_staff=True)
+        self.client.force_login(staff_user)
         response = self.client.get(
             reverse("edit_post", kwargs={"slug": self.post.slug})
         )
         self.assertEqual(response.status_code, 200)
 
+    def test_edit_updates_only_changed_fields(self):
+        """Test saving an edit doesn't rewrite unchanged columns"""
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(
+                reverse("edit_post", kwargs={"slug": self.post.slug}),
+                {
+                    "title": "Renamed Post",
+                    "content": self.post.content,
+                    "category": self.category.id,
+                    "status": "draft",
+                },
+            )
+        (update,) = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertIn('"title"', update)
+        self.assertNotIn('"content"', update)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.title, "Renamed Post")
 
-class DeletePostViewTest(TestCase):
-    """Test delete post view"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.other_user = User.objects.create_user(
-            username="otheruser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
-        self.post = Post.objects.create(
-            title="Test Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-        )
+class DeletePostViewTest(ViewTestCase):
+    """Test delete post view"""
 
-    def test_delete_post_requires_login(self):
-        """Test delete requires login"""
-        response = self.client.get(
-            reverse("delete_post", kwargs={"slug": self.post.slug})
-        )
-        self.assertEqual(response.status_code, 302)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.other_user = create_user("otheruser")
+        cls.category = create_category()
+        cls.post = create_post(cls.user, category=cls.category)
 
     def test_delete_post_get_shows_confirmation(self):
         """Test GET request shows delete confirmation page"""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.get(
             reverse("delete_post", kwargs={"slug": self.post.slug})
         )
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "blog/delete_post.html")
 
-    def test_delete_own_post(self):
-        """Test author can delete own post"""
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.post(
+    def test_delete_post_skips_content(self):
+        """Test the confirmation page doesn't load the post body"""
+        self.client.force_login(self.user)
+        response = self.client.get(
             reverse("delete_post", kwargs={"slug": self.post.slug})
         )
+        self.assertIn("content", response.context["post"].get_deferred_fields())
+
+    def test_delete_own_post(self):
+        """Test author can delete own post"""
+        self.client.force_login(self.user)
+        with self.assertNumQueries(5):
+            response = self.client.post(
+                reverse("delete_post", kwargs={"slug": self.post.slug})
+            )
         self.assertEqual(response.status_code, 302)
-        self.assertFalse(Post.objects.filter(title="Test Post").exists())
+        self.assertFalse(Post.objects.filter(pk=self.post.pk).exists())
 
     def test_cannot_delete_others_post(self):
         """Test user cannot delete others' posts"""
-        self.client.login(username="otheruser", password="testpass123")
+        self.client.force_login(self.other_user)
         response = self.client.get(
             reverse("delete_post", kwargs={"slug": self.post.slug})
         )
         self.assertEqual(response.status_code, 302)
-        self.assertTrue(Post.objects.filter(title="Test Post").exists())
+        self.assertTrue(Post.objects.filter(pk=self.post.pk).exists())
 
     def test_staff_can_delete_any_post(self):
         """Test staff can delete any post"""
-        staff_user = User.objects.create_user(
-            username="staff", password="testpass123", is_staff=True
-        )
-        self.client.login(username="staff", password="testpass123")
+        staff_user = create_user("staff", is_staff=True)
+        self.client.force_login(staff_user)
         response = self.client.post(
             reverse("delete_post", kwargs={"slug": self.post.slug})
         )
         self.assertEqual(response.status_code, 302)
-        self.assertFalse(Post.objects.filter(title="Test Post").exists())
+        self.assertFalse(Post.objects.filter(pk=self.post.pk).exists())
 
 
-class CategoryPostsViewTest(TestCase):
+class CategoryPostsViewTest(ViewTestCase):
     """Test category posts view"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
-        self.post = Post.objects.create(
-            title="Tech Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-            status="published",
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
+        cls.post = create_post(
+            cls.user, title="Tech Post", category=cls.category, status="published"
         )
 
     def test_category_posts_view(self):
@@ -274,51 +312,30 @@ class CategoryPostsViewTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
-class UserPostsViewTest(TestCase):
+class UserPostsViewTest(ViewTestCase):
     """Test user posts view"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
-        self.post = Post.objects.create(
-            title="My Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-        )
-
-    def test_user_posts_requires_login(self):
-        """Test user posts requires login"""
-        response = self.client.get(reverse("user_posts"))
-        self.assertEqual(response.status_code, 302)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
+        cls.post = create_post(cls.user, title="My Post", category=cls.category)
 
     def test_user_posts_view(self):
         """Test user posts page loads"""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.get(reverse("user_posts"))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "My Post")
 
 
-class RegisterViewTest(TestCase):
+class RegisterViewTest(ViewTestCase):
     """Test register view"""
 
-    def setUp(self):
-        self.client = Client()
-
-    def test_register_view_get(self):
-        """Test register page loads"""
-        response = self.client.get(reverse("register"))
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, "blog/register.html")
-
     def test_register_redirects_if_logged_in(self):
         """Test logged in user redirected from register"""
-        user = User.objects.create_user(username="testuser", password="testpass123")
-        self.client.login(username="testuser", password="testpass123")
+        user = create_user()
+        self.client.force_login(user)
         response = self.client.get(reverse("register"))
         self.assertEqual(response.status_code, 302)
 
@@ -336,22 +353,14 @@ class RegisterViewTest(TestCase):
         self.assertTrue(User.objects.filter(username="newuser").exists())
 
 
-class PostDetailCommentTest(TestCase):
+class PostDetailCommentTest(ViewTestCase):
     """Test posting comments on post detail"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
-        self.post = Post.objects.create(
-            title="Test Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-            status="published",
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
+        cls.post = create_post(cls.user, category=cls.category, status="published")
 
     def test_add_comment_requires_login(self):
         """Test adding comment requires login"""
@@ -365,7 +374,7 @@ class PostDetailCommentTest(TestCase):
 
     def test_add_comment_logged_in(self):
         """Test logged in user can add comment"""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(
             reverse("post_detail", kwargs={"slug": self.post.slug}),
             {"content": "Test comment"},
@@ -373,26 +382,40 @@ class PostDetailCommentTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(self.post.comments.count(), 1)
 
+    def test_add_comment_message_skips_session_write(self):
+        """Test the success message is stored in a cookie, not the session"""
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                reverse("post_detail", kwargs={"slug": self.post.slug}),
+                {"content": "Test comment"},
+            )
+        self.assertIn("messages", response.cookies)
+        self.assertFalse(
+            any("UPDATE" in q["sql"] and "django_session" in q["sql"] for q in ctx)
+        )
 
-class HomeViewPaginationTest(TestCase):
+
+class HomeViewPaginationTest(ViewTestCase):
     """Test home view pagination"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
 
-        # Create 15 posts to test pagination
-        for i in range(15):
-            Post.objects.create(
+        # Create 15 posts to test pagination, in a single INSERT
+        Post.objects.bulk_create(
+            Post(
                 title=f"Post {i}",
+                slug=f"post-{i}",
                 content="Content" * 20,
-                author=self.user,
-                category=self.category,
+                author=cls.user,
+                category=cls.category,
                 status="published",
             )
+            for i in range(15)
+        )
 
     def test_pagination(self):
         """Test pagination works"""
@@ -409,19 +432,17 @@ class HomeViewPaginationTest(TestCase):
         self.assertEqual(len(response.context["page_obj"]), 5)
 
 
-class CreatePostPublishedTest(TestCase):
+class CreatePostPublishedTest(ViewTestCase):
     """Test creating published posts"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.category = Category.objects.create(name="Tech")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = create_category()
 
     def test_create_published_post_sets_published_at(self):
         """Test creating published post sets published_at"""
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
         response = self.client.post(
             reverse("create_post"),
             {
@@ -431,56 +452,46 @@ class CreatePostPublishedTest(TestCase):
                 "status": "published",
             },
         )
-        post = Post.objects.get(title="Published Post")
+        post = Post.objects.get(slug="published-post")
         self.assertIsNotNone(post.published_at)
 
     def test_edit_to_published_sets_published_at(self):
         """Test editing draft to published sets published_at"""
-        post = Post.objects.create(
-            title="Draft Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.category,
-            status="draft",
-        )
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.post(
-            reverse("edit_post", kwargs={"slug": post.slug}),
-            {
-                "title": "Draft Post",
-                "content": "Content" * 20,
-                "category": self.category.id,
-                "status": "published",
-            },
-        )
+        post = create_post(
+            self.user, title="Draft Post", category=self.category, status="draft"
+        )
+        self.client.force_login(self.user)
+        with self.assertNumQueries(6):
+            response = self.client.post(
+                reverse("edit_post", kwargs={"slug": post.slug}),
+                {
+                    "title": "Draft Post",
+                    "content": "Content" * 20,
+                    "category": self.category.id,
+                    "status": "published",
+                },
+            )
         post.refresh_from_db()
         self.assertIsNotNone(post.published_at)
 
 
-class HomeViewCategoryFilterTest(TestCase):
+class HomeViewCategoryFilterTest(ViewTestCase):
     """Test filtering by category on home"""
 
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username="testuser", password="testpass123"
-        )
-        self.tech_category = Category.objects.create(name="Tech")
-        self.science_category = Category.objects.create(name="Science")
-
-        self.tech_post = Post.objects.create(
-            title="Tech Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.tech_category,
-            status="published",
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.tech_category = create_category()
+        cls.science_category = create_category("Science")
+
+        cls.tech_post = create_post(
+            cls.user, title="Tech Post", category=cls.tech_category, status="published"
         )
 
-        self.science_post = Post.objects.create(
+        cls.science_post = create_post(
+            cls.user,
             title="Science Post",
-            content="Content" * 20,
-            author=self.user,
-            category=self.science_category,
+            category=cls.science_category,
             status="published",
         )
 
@@ -492,3 +503,99 @@ class HomeViewCategoryFilterTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Tech Post")
         self.assertNotContains(response, "Science Post")
+
+
+class PostAdminCategoryFilterTest(ViewTestCase):
+    """Test the cached category filter on the post changelist"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = create_user("admin", is_staff=True, is_superuser=True)
+        cls.category = create_category()
+        create_post(cls.admin_user, title="Tech Post", category=cls.category)
+        create_post(cls.admin_user, title="Loose Post")
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.admin_user)
+
+    def test_filter_by_category(self):
+        """Test filtering the changelist by a cached category choice"""
+        response = self.client.get(
+            reverse("admin:blog_post_changelist"),
+            {"category__id__exact": self.category.pk},
+        )
+        self.assertContains(response, "Tech Post")
+        self.assertNotContains(response, "Loose Post")
+
+    def test_filter_uncategorised(self):
+        """Test the empty choice lists posts without a category"""
+        response = self.client.get(reverse("admin:blog_post_changelist"))
+        self.assertContains(response, 'href="?category__isnull=True"')
+        response = self.client.get(
+            reverse("admin:blog_post_changelist"), {"category__isnull": "True"}
+        )
+        self.assertContains(response, "Loose Post")
+        self.assertNotContains(response, "Tech Post")
+
+
+class CommentAdminActionTest(ViewTestCase):
+    """Test the bulk approve action on the comment changelist"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = create_user("admin", is_staff=True, is_superuser=True)
+        cls.post = create_post(cls.admin_user, status="published")
+        cls.comment = Comment.objects.create(
+            post=cls.post, author=cls.admin_user, content="Pending"
+        )
+
+    def test_approve_invalidates_post_etag(self):
+        """Test approving via update() still changes the post's ETag"""
+        url = reverse("post_detail", kwargs={"slug": self.post.slug})
+        etag = self.client.get(url)["ETag"]
+        self.client.force_login(self.admin_user)
+        self.client.post(
+            reverse("admin:blog_comment_changelist"),
+            {"action": "approve_comments", "_selected_action": [self.comment.pk]},
+        )
+        self.client.logout()
+        self.comment.refresh_from_db()
+        self.assertTrue(self.comment.approved)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, "Pending")
+
+
+class AnonymousRedirectTests(SimpleTestCase):
+    """Test anonymous requests that never touch the database"""
+
+    databases = []
+
+    def test_create_post_requires_login(self):
+        """Test redirect if not logged in"""
+        response = self.client.get(reverse("create_post"))
+        self.assertRedirects(
+            response, "/login/?next=/post/create/", fetch_redirect_response=False
+        )
+
+    def test_delete_post_requires_login(self):
+        """Test delete requires login"""
+        response = self.client.get(reverse("delete_post", kwargs={"slug": "test-post"}))
+        self.assertRedirects(
+            response,
+            "/login/?next=/post/test-post/delete/",
+            fetch_redirect_response=False,
+        )
+
+    def test_user_posts_requires_login(self):
+        """Test user posts requires login"""
+        response = self.client.get(reverse("user_posts"))
+        self.assertRedirects(
+            response, "/login/?next=/my-posts/", fetch_redirect_response=False
+        )
+
+    def test_register_view_get(self):
+        """Test register page loads"""
+        response = self.client.get(reverse("register"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "blog/register.html")
@@ -1,12 +1,18 @@
-from django.urls import path
+from django.urls import include, path
 from . import views
 
+# Resolved once under the shared post/<slug:slug>/ prefix
+post_patterns = [
+    path("", views.post_detail, name="post_detail"),
+    path("edit/", views.edit_post, name="edit_post"),
+    path("delete/", views.delete_post, name="delete_post"),
+]
+
 urlpatterns = [
     path("", views.home, name="home"),
+    # Must stay ahead of post/<slug:slug>/, "create" is a valid slug
     path("post/create/", views.create_post, name="create_post"),
-    path("post/<slug:slug>/", views.post_detail, name="post_detail"),
-    path("post/<slug:slug>/edit/", views.edit_post, name="edit_post"),
-    path("post/<slug:slug>/delete/", views.delete_post, name="delete_post"),
+    path("post/<slug:slug>/", include(post_patterns)),
     path("category/<slug:slug>/", views.category_posts, name="category_posts"),
     path("my-posts/", views.user_posts, name="user_posts"),
     path("register/", views.register, name="register"),
@@ -3,26 +3,79 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib import messages
+from django.contrib.messages.storage.cookie import CookieStorage
 from django.core.paginator import Paginator
 from django.utils import timezone
-from django.db.models import Q
-from .models import Post, Comment, Category
+from django.utils.crypto import md5
+from django.db.models import Count, Max, Prefetch, Q
+from django.views.decorators.http import condition
+from .models import Post, Comment, Category, get_categories
 from .forms import PostForm, CommentForm
 
 
+def _is_anonymous_read(request):
+    """Whether the response is the same for every visitor and can be revalidated"""
+    return (
+        request.method in ("GET", "HEAD")
+        and not request.user.is_authenticated
+        # A pending flash message is rendered into the page
+        and CookieStorage.cookie_name not in request.COOKIES
+    )
+
+
+def _make_etag(*parts):
+    return md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+# Both validators read the database, so a write from any process (another
+# worker, the shell, create_sample_data) changes them. Author usernames are
+# not covered: renaming a user leaves cached pages showing the old name
+# until a post, comment or category changes.
+
+
+def _home_etag(request):
+    """Changes whenever a published post or a category does"""
+    if not _is_anonymous_read(request):
+        return None
+    # The count catches deletions, which don't move Max(updated_at)
+    posts = Post.objects.published().aggregate(
+        updated=Max("updated_at"), count=Count("pk")
+    )
+    categories = [(c.pk, c.name, c.slug) for c in get_categories()]
+    return _make_etag(posts, categories)
+
+
+def _post_detail_etag(request, slug):
+    """Changes whenever the post, its category or its approved comments do"""
+    if not _is_anonymous_read(request):
+        return None
+    # One query; the comment join is served by comment_post_approved_idx
+    approved = Q(comments__approved=True)
+    post = (
+        Post.objects.published()
+        .filter(slug=slug)
+        .aggregate(
+            updated=Max("updated_at"),
+            category=Max("category__name"),
+            comments_updated=Max("comments__updated_at", filter=approved),
+            comments=Count("comments", filter=approved),
+        )
+    )
+    if post["updated"] is None:
+        return None  # Let the view raise the 404
+    return _make_etag(post)
+
+
+@condition(etag_func=_home_etag)
 def home(request):
     """Home page - list all published posts"""
     search_query = request.GET.get("q", "")
     category_slug = request.GET.get("category", "")
 
-    posts = Post.objects.filter(status="published").select_related("author", "category")
+    posts = Post.objects.published().for_listing().select_related("author", "category")
 
     if search_query:
-        posts = posts.filter(
-            Q(title__icontains=search_query)
-            | Q(content__icontains=search_query)
-            | Q(excerpt__icontains=search_query)
-        )
+        posts = posts.search(search_query)
 
     if category_slug:
         posts = posts.filter(category__slug=category_slug)
@@ -31,7 +84,7 @@ def home(request):
     page_number = request.GET.get("page")
     page_obj = paginator.get_page(page_number)
 
-    categories = Category.objects.all()
+    categories = get_categories()
 
     context = {
         "page_obj": page_obj,
@@ -42,10 +95,22 @@ def home(request):
     return render(request, "blog/home.html", context)
 
 
+@condition(etag_func=_post_detail_etag)
 def post_detail(request, slug):
     """Detail page for a single post"""
-    post = get_object_or_404(Post, slug=slug, status="published")
-    comments = post.approved_comments
+    post = get_object_or_404(
+        Post.objects.published()
+        .select_related("author", "category")
+        .prefetch_related(
+            Prefetch(
+                "comments",
+                queryset=Comment.objects.filter(approved=True).select_related("author"),
+                to_attr="approved_comments_list",
+            )
+        ),
+        slug=slug,
+    )
+    comments = post.approved_comments_list
 
     if request.method == "POST" and request.user.is_authenticated:
         comment_form = CommentForm(request.POST)
@@ -72,8 +137,11 @@ def post_detail(request, slug):
 def category_posts(request, slug):
     """List posts in a specific category"""
     category = get_object_or_404(Category, slug=slug)
-    posts = Post.objects.filter(status="published", category=category).select_related(
-        "author"
+    posts = (
+        Post.objects.published()
+        .filter(category=category)
+        .for_listing()
+        .select_related("author")
     )
 
     paginator = Paginator(posts, 10)
@@ -113,7 +181,7 @@ def edit_post(request, slug):
     post = get_object_or_404(Post, slug=slug)
 
     # Only author or staff can edit
-    if post.author != request.user and not request.user.is_staff:
+    if post.author_id != request.user.id and not request.user.is_staff:
         messages.error(request, "You do not have permission to edit this post.")
         return redirect("post_detail", slug=post.slug)
 
@@ -121,9 +189,12 @@ def edit_post(request, slug):
         form = PostForm(request.POST, request.FILES, instance=post)
         if form.is_valid():
             post = form.save(commit=False)
+            # Only write the columns that actually changed
+            changed_fields = set(form.changed_data)
             if post.status == "published" and not post.published_at:
                 post.published_at = timezone.now()
-            post.save()
+                changed_fields.add("published_at")
+            post.save(update_fields=[*changed_fields, "updated_at"])
             messages.success(request, "Your post has been updated successfully!")
             return redirect("post_detail", slug=post.slug)
     else:
@@ -136,10 +207,11 @@ def edit_post(request, slug):
 @login_required
 def delete_post(request, slug):
     """Delete a blog post"""
-    post = get_object_or_404(Post, slug=slug)
+    # The confirmation page and permission check never need the post body
+    post = get_object_or_404(Post.objects.only("title", "slug", "author"), slug=slug)
 
     # Only author or staff can delete
-    if post.author != request.user and not request.user.is_staff:
+    if post.author_id != request.user.id and not request.user.is_staff:
         messages.error(request, "You do not have permission to delete this post.")
         return redirect("post_detail", slug=post.slug)
 
@@ -155,7 +227,11 @@ def delete_post(request, slug):
 @login_required
 def user_posts(request):
     """List posts by the logged-in user"""
-    posts = Post.objects.filter(author=request.user).select_related("category")
+    posts = (
+        Post.objects.filter(author=request.user)
+        .for_listing()
+        .select_related("category")
+    )
 
     paginator = Paginator(posts, 10)
     page_number = request.GET.get("page")
@@ -98,6 +98,22 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# The local-memory default is per process, so invalidations only reach the
+# worker that made the change. Production with several Gunicorn/uWSGI workers
+# must point this at a shared cache such as Redis.
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -149,3 +165,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 LOGIN_URL = "login"
 LOGIN_REDIRECT_URL = "home"
 LOGOUT_REDIRECT_URL = "home"
+
+# Messages
+# https://docs.djangoproject.com/en/4.2/ref/contrib/messages/#configuring-the-message-engine
+# Keep flash messages in a cookie so they never cause a django_session write
+MESSAGE_STORAGE = "django.contrib.messages.storage.cookie.CookieStorage"
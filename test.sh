@@ -1,4 +1,4 @@
 #!/bin/sh
-./.venv/bin/coverage run --source='.' manage.py test
+./.venv/bin/coverage run --source='.' manage.py test --keepdb
 ./.venv/bin/coverage report
 ./.venv/bin/coverage html
\ No newline at end of file